@@ -42,6 +42,8 @@ class UnorderedSpace(Generic[A]):
 
 
 class Agent:
+    __slots__ = ()
+
     def make_decisions(self, model: Optional["AgentBasedModel"] = None) -> None:
         raise NotImplementedError
 
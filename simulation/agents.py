@@ -1,17 +1,17 @@
 import datetime
 import math
 import random
-from typing import TYPE_CHECKING, Dict, Optional, Set
+from math import exp as _exp
+from math import log as _log
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from abm import Agent
-
-if TYPE_CHECKING:
-    from simulation.model import DomesticHeatingABM
-
 from simulation.constants import (
     BOILERS,
+    DISCOUNT_RATE_CAP,
     DISCOUNT_RATE_WEIBULL_ALPHA,
     DISCOUNT_RATE_WEIBULL_BETA,
     FLOOR_AREA_SQM_33RD_PERCENTILE,
@@ -21,6 +21,7 @@ from simulation.constants import (
     GB_PROPERTY_VALUE_WEIBULL_BETA,
     GB_RENOVATION_BUDGET_WEIBULL_ALPHA,
     GB_RENOVATION_BUDGET_WEIBULL_BETA,
+    GLAZING_BITMASK,
     HAZARD_RATE_HEATING_SYSTEM_ALPHA,
     HAZARD_RATE_HEATING_SYSTEM_BETA,
     HEAT_PUMP_CAPACITY_SCALE_FACTOR,
@@ -34,15 +35,20 @@ from simulation.constants import (
     RENO_NUM_INSULATION_ELEMENTS_UPGRADED,
     RENO_PROBA_HEATING_SYSTEM_UPDATE,
     RENO_PROBA_INSULATION_UPDATE,
+    RENOVATE_HEATING_SYSTEM_FLAG,
+    RENOVATE_INSULATION_FLAG,
     RETROFIT_COSTS_SMALL_PROPERTY_SQM_LIMIT,
+    ROOF_BITMASK,
     SIGMOID_K,
     SIGMOID_OFFSET,
+    WALLS_BITMASK,
+    WEALTH_PERCENTILE_CAP,
+    WEALTH_PERCENTILE_FLOOR,
     BuiltForm,
     ConstructionYearBand,
     Element,
     EPCRating,
     EventTrigger,
-    HeatingFuel,
     HeatingSystem,
     InsulationSegment,
     InterventionType,
@@ -51,10 +57,14 @@ from simulation.constants import (
     PropertyType,
 )
 from simulation.costs import (
-    CAVITY_WALL_INSULATION_COST,
-    DOUBLE_GLAZING_UPVC_COST,
-    INTERNAL_WALL_INSULATION_COST,
-    LOFT_INSULATION_JOISTS_COST,
+    CAVITY_WALL_INSULATION_COST_HIGH,
+    CAVITY_WALL_INSULATION_COST_LOW,
+    DOUBLE_GLAZING_UPVC_COST_HIGH,
+    DOUBLE_GLAZING_UPVC_COST_LOW,
+    INTERNAL_WALL_INSULATION_COST_HIGH,
+    INTERNAL_WALL_INSULATION_COST_LOW,
+    LOFT_INSULATION_JOISTS_COST_HIGH,
+    LOFT_INSULATION_JOISTS_COST_LOW,
     discount_annual_cash_flow,
     estimate_boiler_upgrade_scheme_grant,
     estimate_extended_boiler_upgrade_scheme_grant,
@@ -63,9 +73,12 @@ from simulation.costs import (
     get_unit_and_install_costs,
 )
 
+if TYPE_CHECKING:
+    from simulation.model import DomesticHeatingABM
+
 
-def sample_interval_uniformly(interval: pd.Interval) -> float:
-    return random.randint(interval.left, interval.right)
+def sample_interval_uniformly(low: float, high: float) -> float:
+    return random.uniform(low, high)
 
 
 def true_with_probability(p: float) -> bool:
@@ -75,13 +88,51 @@ def true_with_probability(p: float) -> bool:
 def get_weibull_percentile_from_value(
     alpha: float, beta: float, input_value: float
 ) -> float:
-    return 1 - math.exp(-((input_value / beta) ** alpha))
+    return 1 - _exp(-((input_value / beta) ** alpha))
 
 
 def get_weibull_value_from_percentile(
     alpha: float, beta: float, percentile: float
 ) -> float:
-    return beta * (-math.log(1 - percentile)) ** (1 / alpha)
+    return beta * (-_log(1 - percentile)) ** (1 / alpha)
+
+
+def get_weibull_percentiles_from_values(
+    alpha: float, beta: float, input_values: np.ndarray
+) -> np.ndarray:
+    return -np.expm1(-((input_values / beta) ** alpha))
+
+
+def get_weibull_values_from_percentiles(
+    alpha: float, beta: float, percentiles: np.ndarray
+) -> np.ndarray:
+    return beta * (-np.log1p(-percentiles)) ** (1 / alpha)
+
+
+def get_wealth_percentiles(property_values_gbp: np.ndarray) -> np.ndarray:
+    percentiles = get_weibull_percentiles_from_values(
+        GB_PROPERTY_VALUE_WEIBULL_ALPHA,
+        GB_PROPERTY_VALUE_WEIBULL_BETA,
+        property_values_gbp,
+    )
+    return np.clip(percentiles, WEALTH_PERCENTILE_FLOOR, WEALTH_PERCENTILE_CAP)
+
+
+def get_discount_rates(wealth_percentiles: np.ndarray) -> np.ndarray:
+    discount_rates = get_weibull_values_from_percentiles(
+        DISCOUNT_RATE_WEIBULL_ALPHA,
+        DISCOUNT_RATE_WEIBULL_BETA,
+        1 - wealth_percentiles,
+    )
+    return np.minimum(discount_rates, DISCOUNT_RATE_CAP)
+
+
+def get_renovation_budgets(wealth_percentiles: np.ndarray) -> np.ndarray:
+    return HEATING_PROPORTION_OF_RENO_BUDGET * get_weibull_values_from_percentiles(
+        GB_RENOVATION_BUDGET_WEIBULL_ALPHA,
+        GB_RENOVATION_BUDGET_WEIBULL_BETA,
+        wealth_percentiles,
+    )
 
 
 def weibull_hazard_rate(alpha: float, beta: float, age_years: float) -> float:
@@ -98,10 +149,49 @@ def weibull_hazard_rate(alpha: float, beta: float, age_years: float) -> float:
 
 def reverse_sigmoid(x: float, k: float = SIGMOID_K, offset: float = SIGMOID_OFFSET):
 
-    return 1 / (1 + math.exp(k * (x + offset)))
+    return 1 / (1 + _exp(k * (x + offset)))
 
 
 class Household(Agent):
+    __slots__ = (
+        "id",
+        "location",
+        "property_value_gbp",
+        "total_floor_area_m2",
+        "is_off_gas_grid",
+        "construction_year_band",
+        "property_type",
+        "built_form",
+        "occupant_type",
+        "is_solid_wall",
+        "insulation_segment",
+        "wealth_percentile",
+        "discount_rate",
+        "renovation_budget",
+        "is_heat_pump_suitable_archetype",
+        "heating_functioning",
+        "heating_system",
+        "heating_fuel",
+        "heating_system_previous",
+        "heating_system_install_date",
+        "epc_rating",
+        "potential_epc_rating",
+        "walls_energy_efficiency",
+        "roof_energy_efficiency",
+        "windows_energy_efficiency",
+        "is_heat_pump_aware",
+        "is_renovating",
+        "renovation_scope",
+        "heating_system_costs_unit_and_install",
+        "heating_system_costs_fuel",
+        "heating_system_costs_subsidies",
+        "heating_system_costs_insulation",
+        "insulation_element_upgrade_costs",
+        "boiler_upgrade_grant_available",
+        "boiler_upgrade_grant_used",
+        "population_index",
+    )
+
     def __init__(
         self,
         id: int,
@@ -123,6 +213,9 @@ class Household(Agent):
         roof_energy_efficiency: int,
         is_heat_pump_suitable_archetype: bool,
         is_heat_pump_aware: bool,
+        wealth_percentile: Optional[float] = None,
+        discount_rate: Optional[float] = None,
+        renovation_budget: Optional[float] = None,
     ):
         self.id = id
         # Property / tenure attributes
@@ -135,11 +228,52 @@ class Household(Agent):
         self.is_solid_wall = is_solid_wall
         self.construction_year_band = construction_year_band
         self.is_heat_pump_suitable_archetype = is_heat_pump_suitable_archetype
+        self.insulation_segment = self.get_insulation_segment()
+
+        # Wealth attributes depend only on property value, so are computed once.
+        # They may be precomputed for a whole population with `get_wealth_percentiles`,
+        # `get_discount_rates` and `get_renovation_budgets`
+        if wealth_percentile is None:
+            wealth_percentile = min(
+                max(
+                    get_weibull_percentile_from_value(
+                        GB_PROPERTY_VALUE_WEIBULL_ALPHA,
+                        GB_PROPERTY_VALUE_WEIBULL_BETA,
+                        property_value_gbp,
+                    ),
+                    WEALTH_PERCENTILE_FLOOR,
+                ),
+                WEALTH_PERCENTILE_CAP,
+            )
+        self.wealth_percentile = wealth_percentile
+
+        if discount_rate is None:
+            discount_rate = min(
+                get_weibull_value_from_percentile(
+                    DISCOUNT_RATE_WEIBULL_ALPHA,
+                    DISCOUNT_RATE_WEIBULL_BETA,
+                    1 - self.wealth_percentile,
+                ),
+                DISCOUNT_RATE_CAP,
+            )
+        self.discount_rate = discount_rate
+
+        if renovation_budget is None:
+            renovation_budget = (
+                HEATING_PROPORTION_OF_RENO_BUDGET
+                * get_weibull_value_from_percentile(
+                    GB_RENOVATION_BUDGET_WEIBULL_ALPHA,
+                    GB_RENOVATION_BUDGET_WEIBULL_BETA,
+                    self.wealth_percentile,
+                )
+            )
+        self.renovation_budget = renovation_budget
 
         # Heating / energy performance attributes
         self.is_off_gas_grid = is_off_gas_grid
         self.heating_functioning = True
         self.heating_system = heating_system
+        self.heating_fuel = HEATING_SYSTEM_FUEL[heating_system]
         self.heating_system_previous = None
         self.heating_system_install_date = heating_system_install_date
         self.epc_rating = epc_rating
@@ -153,51 +287,21 @@ class Household(Agent):
 
         # Household investment decision attributes
         self.is_renovating = False
-        self.renovate_insulation = False
-        self.renovate_heating_system = False
+        self.renovation_scope = 0
         self.reset_previous_heating_decision_log()
 
-    @property
-    def heating_fuel(self) -> HeatingFuel:
-        return HEATING_SYSTEM_FUEL[self.heating_system]
+        # Position in the model's `HouseholdPopulation`, if the household belongs to one
+        self.population_index: Optional[int] = None
 
     @property
-    def wealth_percentile(self) -> float:
-
-        PERCENTILE_FLOOR = 0.001
-        PERCENTILE_CAP = 0.999
-
-        percentile = get_weibull_percentile_from_value(
-            GB_PROPERTY_VALUE_WEIBULL_ALPHA,
-            GB_PROPERTY_VALUE_WEIBULL_BETA,
-            self.property_value_gbp,
-        )
-
-        return min(max(percentile, PERCENTILE_FLOOR), PERCENTILE_CAP)
+    def renovate_insulation(self) -> bool:
+        return bool(self.renovation_scope & RENOVATE_INSULATION_FLAG)
 
     @property
-    def discount_rate(self) -> float:
+    def renovate_heating_system(self) -> bool:
+        return bool(self.renovation_scope & RENOVATE_HEATING_SYSTEM_FLAG)
 
-        DISCOUNT_RATE_CAP = 1
-        percentile = get_weibull_value_from_percentile(
-            DISCOUNT_RATE_WEIBULL_ALPHA,
-            DISCOUNT_RATE_WEIBULL_BETA,
-            1 - self.wealth_percentile,
-        )
-
-        return min(percentile, DISCOUNT_RATE_CAP)
-
-    @property
-    def renovation_budget(self) -> float:
-
-        return HEATING_PROPORTION_OF_RENO_BUDGET * get_weibull_value_from_percentile(
-            GB_RENOVATION_BUDGET_WEIBULL_ALPHA,
-            GB_RENOVATION_BUDGET_WEIBULL_BETA,
-            self.wealth_percentile,
-        )
-
-    @property
-    def insulation_segment(self) -> InsulationSegment:
+    def get_insulation_segment(self) -> Optional[InsulationSegment]:
 
         if self.property_type == PropertyType.FLAT:
             if (
@@ -278,7 +382,7 @@ class Household(Agent):
 
         return int(
             self.annual_kwh_heating_demand
-            * model.fuel_price_gbp_per_kwh[HEATING_SYSTEM_FUEL[self.heating_system]]
+            * model.fuel_price_gbp_per_kwh[self.heating_fuel]
         )
 
     def heating_system_age_years(self, current_date: datetime.date) -> float:
@@ -290,40 +394,52 @@ class Household(Agent):
         return True
 
     def evaluate_renovation(self, model) -> None:
-        step_interval_years = (
-            model.step_interval.months + (12 * model.step_interval.years)
-        ) / 12
-        proba_renovate = model.annual_renovation_rate * step_interval_years
-        self.is_renovating = true_with_probability(proba_renovate)
-
-        self.renovate_heating_system = (
-            true_with_probability(RENO_PROBA_HEATING_SYSTEM_UPDATE)
-            if self.is_renovating
-            else False
-        )
-        self.renovate_insulation = (
-            true_with_probability(RENO_PROBA_INSULATION_UPDATE)
-            if self.is_renovating
-            else False
-        )
+        population = model.population
+        if population is not None and self.population_index is not None:
+            # Renovation decisions are drawn for the whole population once per step
+            self.is_renovating = bool(population.is_renovating[self.population_index])
+            self.renovation_scope = int(
+                population.renovation_scope[self.population_index]
+            )
+            return
 
-    def get_upgradable_insulation_elements(self) -> Set[Element]:
+        self.is_renovating = true_with_probability(model.proba_renovate_per_step)
 
-        measures_and_grades = zip(
-            [Element.WALLS, Element.ROOF, Element.GLAZING],
-            [
-                self.walls_energy_efficiency,
-                self.roof_energy_efficiency,
-                self.windows_energy_efficiency,
-            ],
-        )
+        self.renovation_scope = 0
+        if self.is_renovating:
+            if true_with_probability(RENO_PROBA_HEATING_SYSTEM_UPDATE):
+                self.renovation_scope |= RENOVATE_HEATING_SYSTEM_FLAG
+            if true_with_probability(RENO_PROBA_INSULATION_UPDATE):
+                self.renovation_scope |= RENOVATE_INSULATION_FLAG
+
+    def get_upgradable_insulation_elements(self) -> int:
+        """
+        Returns a bitmask of the elements below the maximum energy efficiency score
+        (see `ROOF_BITMASK`, `GLAZING_BITMASK` and `WALLS_BITMASK`).
+        """
 
         MAX_ENERGY_EFFICIENCY_SCORE = 5
-        return {
-            measure
-            for measure, grade in measures_and_grades
-            if not pd.isna(grade) and (grade < MAX_ENERGY_EFFICIENCY_SCORE)
-        }
+        roof = self.roof_energy_efficiency
+        windows = self.windows_energy_efficiency
+        walls = self.walls_energy_efficiency
+
+        return (
+            (
+                ROOF_BITMASK
+                if not pd.isna(roof) and roof < MAX_ENERGY_EFFICIENCY_SCORE
+                else 0
+            )
+            | (
+                GLAZING_BITMASK
+                if not pd.isna(windows) and windows < MAX_ENERGY_EFFICIENCY_SCORE
+                else 0
+            )
+            | (
+                WALLS_BITMASK
+                if not pd.isna(walls) and walls < MAX_ENERGY_EFFICIENCY_SCORE
+                else 0
+            )
+        )
 
     def get_num_insulation_elements(self, event_trigger: EventTrigger) -> int:
 
@@ -341,36 +457,52 @@ class Household(Agent):
         return 0
 
     def get_quote_insulation_elements(
-        self, elements: Set[Element]
-    ) -> Dict[Element, float]:
-
-        insulation_quotes = {element: 0 for element in elements}
-        for element in elements:
-            if element == Element.WALLS:
-                if self.is_solid_wall:
-                    cost_range = INTERNAL_WALL_INSULATION_COST[self.insulation_segment]
-                    insulation_quotes[element] = sample_interval_uniformly(cost_range)
-                else:
-                    cost_range = CAVITY_WALL_INSULATION_COST[self.insulation_segment]
-                    insulation_quotes[element] = sample_interval_uniformly(cost_range)
-            if element == Element.GLAZING:
-                cost_range = DOUBLE_GLAZING_UPVC_COST[self.insulation_segment]
-                insulation_quotes[element] = sample_interval_uniformly(cost_range)
-            if element == Element.ROOF:
-                cost_range = LOFT_INSULATION_JOISTS_COST[self.insulation_segment]
-                insulation_quotes[element] = sample_interval_uniformly(cost_range)
+        self, elements: int
+    ) -> Tuple[float, float, float]:
+        """
+        Quotes for the insulation elements in the `elements` bitmask, indexed by `Element`.
+        Elements outside of the bitmask are quoted at 0.
+        """
+
+        segment = self.insulation_segment
+        roof_quote = glazing_quote = walls_quote = 0.0
+        if elements & WALLS_BITMASK:
+            if self.is_solid_wall:
+                walls_quote = sample_interval_uniformly(
+                    INTERNAL_WALL_INSULATION_COST_LOW[segment],
+                    INTERNAL_WALL_INSULATION_COST_HIGH[segment],
+                )
+            else:
+                walls_quote = sample_interval_uniformly(
+                    CAVITY_WALL_INSULATION_COST_LOW[segment],
+                    CAVITY_WALL_INSULATION_COST_HIGH[segment],
+                )
+        if elements & GLAZING_BITMASK:
+            glazing_quote = sample_interval_uniformly(
+                DOUBLE_GLAZING_UPVC_COST_LOW[segment],
+                DOUBLE_GLAZING_UPVC_COST_HIGH[segment],
+            )
+        if elements & ROOF_BITMASK:
+            roof_quote = sample_interval_uniformly(
+                LOFT_INSULATION_JOISTS_COST_LOW[segment],
+                LOFT_INSULATION_JOISTS_COST_HIGH[segment],
+            )
 
-        return insulation_quotes
+        return roof_quote, glazing_quote, walls_quote
 
     def choose_insulation_elements(
-        self, insulation_quotes: Dict[Element, float], num_elements: int
+        self,
+        insulation_quotes: Tuple[float, float, float],
+        elements: int,
+        num_elements: int,
     ) -> Dict[Element, float]:
 
         return {
             element: insulation_quotes[element]
-            for element in sorted(insulation_quotes, key=insulation_quotes.get)[
-                :num_elements
-            ]
+            for element in sorted(
+                (element for element in Element if elements & (1 << element)),
+                key=insulation_quotes.__getitem__,
+            )[:num_elements]
         }
 
     def install_insulation_elements(
@@ -394,13 +526,18 @@ class Household(Agent):
     def get_chosen_insulation_costs(self, event_trigger: EventTrigger):
 
         upgradable_elements = self.get_upgradable_insulation_elements()
-        insulation_quotes = self.get_quote_insulation_elements(upgradable_elements)
-
         num_elements = min(
-            len(upgradable_elements), self.get_num_insulation_elements(event_trigger)
+            bin(upgradable_elements).count("1"),
+            self.get_num_insulation_elements(event_trigger),
         )
+        if not num_elements:
+            return {}
+
+        insulation_quotes = self.get_quote_insulation_elements(upgradable_elements)
 
-        return self.choose_insulation_elements(insulation_quotes, num_elements)
+        return self.choose_insulation_elements(
+            insulation_quotes, upgradable_elements, num_elements
+        )
 
     def get_proba_rule_out_banned_heating_systems(self, model):
 
@@ -538,13 +675,13 @@ class Household(Agent):
     ):
 
         weights = []
-        multiple_cap = 50  # An arbitrary cap to prevent math.exp overflowing
+        multiple_cap = 50  # An arbitrary cap to prevent exp overflowing
 
         for heating_system in costs.keys():
             cost_as_proportion_of_budget = min(
                 costs[heating_system] / self.renovation_budget, multiple_cap
             )
-            weight = 1 / math.exp(cost_as_proportion_of_budget)
+            weight = 1 / _exp(cost_as_proportion_of_budget)
             if self.is_heating_system_hassle(heating_system):
                 heating_system_hassle_factor = self.reset_heating_system_hassle(
                     heating_system_hassle_factor,
@@ -554,7 +691,7 @@ class Household(Agent):
             weights.append(weight)
 
         #  Households for which all options are highly unaffordable (x10 out of budget) "repair" their existing heating system
-        threshold_weight = 1 / math.exp(10)
+        threshold_weight = 1 / _exp(10)
         if all([w < threshold_weight for w in weights]):
             return self.heating_system
 
@@ -566,6 +703,7 @@ class Household(Agent):
 
         self.heating_system_previous = self.heating_system
         self.heating_system = heating_system
+        self.heating_fuel = HEATING_SYSTEM_FUEL[heating_system]
         self.heating_system_install_date = model.current_datetime.date()
 
         if self.boiler_upgrade_grant_available:
@@ -589,16 +727,20 @@ class Household(Agent):
 
         self.reset_previous_heating_decision_log()
 
-        step_interval_years = (
-            model.step_interval.months + (12 * model.step_interval.years)
-        ) / 12
         probability_density = weibull_hazard_rate(
             HAZARD_RATE_HEATING_SYSTEM_ALPHA,
             HAZARD_RATE_HEATING_SYSTEM_BETA,
             self.heating_system_age_years(model.current_datetime.date()),
         )
-        proba_failure = probability_density * step_interval_years
-        if random.random() < proba_failure:
+        proba_failure = probability_density * model.step_interval_years
+
+        population = model.population
+        if population is not None and self.population_index is not None:
+            failure_draw = population.heating_failure_draws[self.population_index]
+        else:
+            failure_draw = random.random()
+
+        if failure_draw < proba_failure:
             self.heating_functioning = False
         else:
             self.heating_functioning = True
@@ -656,14 +798,14 @@ class Household(Agent):
         self.evaluate_renovation(model)
 
         if self.is_renovating:
-            if self.renovate_insulation:
+            if self.renovation_scope & RENOVATE_INSULATION_FLAG:
                 chosen_elements = self.get_chosen_insulation_costs(
                     event_trigger=EventTrigger.RENOVATION
                 )
                 self.install_insulation_elements(chosen_elements)
 
         if not self.heating_functioning or (
-            self.is_renovating and self.renovate_heating_system
+            self.is_renovating and self.renovation_scope & RENOVATE_HEATING_SYSTEM_FLAG
         ):
 
             if not self.heating_functioning:
@@ -48,7 +48,7 @@ def household_heating_system(household) -> str:
 def household_heating_system_previous(household) -> Optional[str]:
     return (
         household.heating_system_previous.name
-        if household.heating_system_previous
+        if household.heating_system_previous is not None
         else None
     )
 
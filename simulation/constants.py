@@ -2,13 +2,13 @@ import enum
 from typing import Dict
 
 
-class PropertyType(enum.Enum):
+class PropertyType(enum.IntEnum):
     HOUSE = 0
     FLAT = 1
     BUNGALOW = 2
 
 
-class BuiltForm(enum.Enum):
+class BuiltForm(enum.IntEnum):
     MID_TERRACE = 0
     SEMI_DETACHED = 1
     DETACHED = 2
@@ -31,7 +31,7 @@ class EPCRating(enum.Enum):
     A = 6
 
 
-class HeatingSystem(enum.Enum):
+class HeatingSystem(enum.IntEnum):
     BOILER_GAS = 0
     BOILER_OIL = 1
     BOILER_ELECTRIC = 2
@@ -39,19 +39,23 @@ class HeatingSystem(enum.Enum):
     HEAT_PUMP_GROUND_SOURCE = 4
 
 
-class HeatingFuel(enum.Enum):
+class HeatingFuel(enum.IntEnum):
     GAS = 0
     ELECTRICITY = 1
     OIL = 2
 
 
-HEATING_SYSTEM_FUEL: Dict[HeatingSystem, HeatingFuel] = {
-    HeatingSystem.BOILER_GAS: HeatingFuel.GAS,
-    HeatingSystem.BOILER_OIL: HeatingFuel.OIL,
-    HeatingSystem.BOILER_ELECTRIC: HeatingFuel.ELECTRICITY,
-    HeatingSystem.HEAT_PUMP_AIR_SOURCE: HeatingFuel.ELECTRICITY,
-    HeatingSystem.HEAT_PUMP_GROUND_SOURCE: HeatingFuel.ELECTRICITY,
-}
+# `HeatingFuel` indexed by `HeatingSystem`
+HEATING_SYSTEM_FUEL = tuple(
+    {
+        HeatingSystem.BOILER_GAS: HeatingFuel.GAS,
+        HeatingSystem.BOILER_OIL: HeatingFuel.OIL,
+        HeatingSystem.BOILER_ELECTRIC: HeatingFuel.ELECTRICITY,
+        HeatingSystem.HEAT_PUMP_AIR_SOURCE: HeatingFuel.ELECTRICITY,
+        HeatingSystem.HEAT_PUMP_GROUND_SOURCE: HeatingFuel.ELECTRICITY,
+    }[heating_system]
+    for heating_system in sorted(HeatingSystem)
+)
 
 HEATING_SYSTEM_LIFETIME_YEARS = 15
 HAZARD_RATE_HEATING_SYSTEM_ALPHA = 6
@@ -90,14 +94,24 @@ GB_RENOVATION_BUDGET_WEIBULL_BETA = 21_994
 GB_PROPERTY_VALUE_WEIBULL_ALPHA = 1.61
 GB_PROPERTY_VALUE_WEIBULL_BETA = 280_000
 
+# Bounds on household wealth percentiles, avoiding infinite values at the tails of the distribution
+WEALTH_PERCENTILE_FLOOR = 0.001
+WEALTH_PERCENTILE_CAP = 0.999
+
 
-class Element(enum.Enum):
+class Element(enum.IntEnum):
     ROOF = 0
     GLAZING = 1
     WALLS = 2
 
 
-class InsulationSegment(enum.Enum):
+# Sets of insulation elements are encoded as integer bitmasks, with bit `element` set for each element
+ROOF_BITMASK = 1 << Element.ROOF
+GLAZING_BITMASK = 1 << Element.GLAZING
+WALLS_BITMASK = 1 << Element.WALLS
+
+
+class InsulationSegment(enum.IntEnum):
     SMALL_FLAT = 0
     LARGE_FLAT = 1
     SMALL_MID_TERRACE_HOUSE = 2
@@ -114,6 +128,8 @@ class InsulationSegment(enum.Enum):
 # Individual Time Preferences and Energy Efficiency (NBER Working Paper No. 20969)
 DISCOUNT_RATE_WEIBULL_ALPHA = 0.8
 DISCOUNT_RATE_WEIBULL_BETA = 0.165
+# Upper bound on household discount rates, avoiding extreme values at the tail of the distribution
+DISCOUNT_RATE_CAP = 1
 
 
 class EventTrigger(enum.Enum):
@@ -177,6 +193,10 @@ BOILERS = {
 RENO_PROBA_HEATING_SYSTEM_UPDATE = 0.18
 RENO_PROBA_INSULATION_UPDATE = 0.33
 
+# The scope of a renovation is encoded as an integer bitfield of these flags
+RENOVATE_INSULATION_FLAG = 1
+RENOVATE_HEATING_SYSTEM_FLAG = 1 << 1
+
 # Likelihood of upgrading 1,2 or 3 insulation elements during a renovation
 # Derived from the VERD Project, 2012-2013. UK Data Service. SN: 7773, http://doi.org/10.5255/UKDA-SN-7773-1
 # Based upon the choices of houses in 'Stage 3' - finalising or actively renovating
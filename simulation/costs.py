@@ -1,7 +1,8 @@
 import datetime
 import random
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Tuple
 
+import numpy as np
 import pandas as pd
 
 from simulation.constants import (
@@ -67,6 +68,34 @@ DOUBLE_GLAZING_UPVC_COST = {
     InsulationSegment.BUNGALOW: pd.Interval(5_800, 8_000),
 }
 
+
+def get_cost_bounds_by_segment(
+    costs: Dict[InsulationSegment, pd.Interval]
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Lower and upper bounds of each segment's cost range, indexed by `InsulationSegment`
+    return (
+        np.array([costs[segment].left for segment in InsulationSegment]),
+        np.array([costs[segment].right for segment in InsulationSegment]),
+    )
+
+
+(
+    CAVITY_WALL_INSULATION_COST_LOW,
+    CAVITY_WALL_INSULATION_COST_HIGH,
+) = get_cost_bounds_by_segment(CAVITY_WALL_INSULATION_COST)
+(
+    INTERNAL_WALL_INSULATION_COST_LOW,
+    INTERNAL_WALL_INSULATION_COST_HIGH,
+) = get_cost_bounds_by_segment(INTERNAL_WALL_INSULATION_COST)
+(
+    LOFT_INSULATION_JOISTS_COST_LOW,
+    LOFT_INSULATION_JOISTS_COST_HIGH,
+) = get_cost_bounds_by_segment(LOFT_INSULATION_JOISTS_COST)
+(
+    DOUBLE_GLAZING_UPVC_COST_LOW,
+    DOUBLE_GLAZING_UPVC_COST_HIGH,
+) = get_cost_bounds_by_segment(DOUBLE_GLAZING_UPVC_COST)
+
 MEDIAN_COST_GBP_HEAT_PUMP_AIR_SOURCE: Dict[int, int] = {
     # Source: RHI December 2020 Data
     # Adjusted for monotonicity: cost at each capacity >= highest trailing value
@@ -1,13 +1,19 @@
 import datetime
 import random
 from bisect import bisect
-from typing import Dict, Iterator, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
 from abm import AgentBasedModel, UnorderedSpace
-from simulation.agents import Household
+from simulation.agents import (
+    Household,
+    get_discount_rates,
+    get_renovation_budgets,
+    get_wealth_percentiles,
+)
 from simulation.collectors import get_agent_collectors, get_model_collectors
 from simulation.constants import (
     ENGLAND_WALES_HOUSEHOLD_COUNT_2020,
@@ -23,6 +29,20 @@ from simulation.constants import (
     OccupantType,
     PropertyType,
 )
+from simulation.population import HouseholdPopulation
+
+
+def default_rng() -> np.random.Generator:
+    # Seeded from `random`, so seeding `random` also makes numpy draws reproducible
+    return np.random.default_rng(random.getrandbits(128))
+
+
+def get_step_interval_years(
+    step_interval: Union[relativedelta, datetime.timedelta]
+) -> float:
+    if isinstance(step_interval, datetime.timedelta):
+        return step_interval / datetime.timedelta(days=365)
+    return (step_interval.months + (12 * step_interval.years)) / 12
 
 
 class DomesticHeatingABM(AgentBasedModel):
@@ -51,11 +71,14 @@ class DomesticHeatingABM(AgentBasedModel):
             List[Tuple[datetime.datetime, float]]
         ],
         population_heat_pump_awareness: List[bool],
+        rng: Optional[np.random.Generator] = None,
     ):
         self.start_datetime = start_datetime
         self.step_interval = step_interval
+        self.step_interval_years = get_step_interval_years(step_interval)
         self.current_datetime = start_datetime
         self.annual_renovation_rate = annual_renovation_rate
+        self.proba_renovate_per_step = annual_renovation_rate * self.step_interval_years
         self.household_num_lookahead_years = household_num_lookahead_years
         self.heating_system_hassle_factor = heating_system_hassle_factor
         self.rented_heating_system_hassle_factor = rented_heating_system_hassle_factor
@@ -90,6 +113,9 @@ class DomesticHeatingABM(AgentBasedModel):
         self.num_households_heat_pump_aware = sum(population_heat_pump_awareness)
         self.num_households_switching_to_heat_pump_aware = 0
 
+        self.population: Optional[HouseholdPopulation] = None
+        self.rng = rng if rng is not None else default_rng()
+
         super().__init__(UnorderedSpace())
 
     @property
@@ -241,13 +267,33 @@ class DomesticHeatingABM(AgentBasedModel):
         self.heat_pump_installations_at_current_step = 0
         self.num_households_switching_to_heat_pump_aware_at_current_timestep = 0
 
+        if self.population is not None:
+            self.population.step(self)
+
 
 def create_household_agents(
     household_population: pd.DataFrame,
     population_heat_pump_awareness: List[bool],
     simulation_start_datetime: datetime.datetime,
     all_agents_heat_pump_suitable: bool,
+    rng: Optional[np.random.Generator] = None,
 ) -> Iterator[Household]:
+    if rng is None:
+        rng = default_rng()
+
+    heating_system_ages_days = rng.integers(
+        0,
+        365 * HEATING_SYSTEM_LIFETIME_YEARS,
+        size=len(household_population),
+        endpoint=True,
+    ).tolist()
+    wealth_percentiles = get_wealth_percentiles(
+        household_population["property_value_gbp"].to_numpy(dtype=float)
+    )
+    discount_rates = get_discount_rates(wealth_percentiles).tolist()
+    renovation_budgets = get_renovation_budgets(wealth_percentiles).tolist()
+    wealth_percentiles = wealth_percentiles.tolist()
+
     for i, household in enumerate(household_population.itertuples()):
         yield Household(
             id=household.id,
@@ -264,9 +310,7 @@ def create_household_agents(
             built_form=BuiltForm[household.built_form.upper()],
             heating_system=HeatingSystem[household.heating_system.upper()],
             heating_system_install_date=simulation_start_datetime.date()
-            - datetime.timedelta(
-                days=random.randint(0, 365 * HEATING_SYSTEM_LIFETIME_YEARS)
-            ),
+            - datetime.timedelta(days=heating_system_ages_days[i]),
             epc_rating=EPCRating[household.epc_rating.upper()],
             potential_epc_rating=EPCRating[household.potential_epc_rating.upper()],
             occupant_type=OccupantType[household.occupant_type.upper()],
@@ -278,6 +322,9 @@ def create_household_agents(
             if all_agents_heat_pump_suitable
             else household.is_heat_pump_suitable_archetype,
             is_heat_pump_aware=population_heat_pump_awareness[i],
+            wealth_percentile=wealth_percentiles[i],
+            discount_rate=discount_rates[i],
+            renovation_budget=renovation_budgets[i],
         )
 
 
@@ -309,9 +356,10 @@ def create_and_run_simulation(
     ],
 ):
 
-    population_heat_pump_awareness = [
-        random.random() < heat_pump_awareness for _ in range(len(household_population))
-    ]
+    rng = default_rng()
+    population_heat_pump_awareness = (
+        rng.random(len(household_population)) < heat_pump_awareness
+    ).tolist()
 
     model = DomesticHeatingABM(
         start_datetime=start_datetime,
@@ -333,16 +381,21 @@ def create_and_run_simulation(
         heat_pump_awareness=heat_pump_awareness,
         heat_pump_awareness_campaign_schedule=heat_pump_awareness_campaign_schedule,
         population_heat_pump_awareness=population_heat_pump_awareness,
+        rng=rng,
     )
 
-    households = create_household_agents(
-        household_population,
-        population_heat_pump_awareness,
-        model.start_datetime,
-        all_agents_heat_pump_suitable,
+    households = list(
+        create_household_agents(
+            household_population,
+            population_heat_pump_awareness,
+            model.start_datetime,
+            all_agents_heat_pump_suitable,
+            model.rng,
+        )
     )
 
     model.add_agents(households)
+    model.population = HouseholdPopulation(households)
 
     agent_collectors = get_agent_collectors(model)
     model_collectors = get_model_collectors(model)
@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+
+from simulation.agents import Household
+from simulation.constants import (
+    RENO_PROBA_HEATING_SYSTEM_UPDATE,
+    RENO_PROBA_INSULATION_UPDATE,
+    RENOVATE_HEATING_SYSTEM_FLAG,
+    RENOVATE_INSULATION_FLAG,
+)
+
+if TYPE_CHECKING:
+    from simulation.model import DomesticHeatingABM
+
+
+def _step_population(
+    random_draws: np.ndarray,
+    proba_renovate: float,
+    out_is_renovating: np.ndarray,
+    out_renovation_scope: np.ndarray,
+) -> None:
+    """
+    Renovation decisions for the whole population, written in place.
+    `random_draws` has one row of uniform draws per household, of which the first three are used.
+    """
+    np.less(random_draws[:, 0], proba_renovate, out=out_is_renovating)
+    renovate_heating_system = random_draws[:, 1] < RENO_PROBA_HEATING_SYSTEM_UPDATE
+    renovate_insulation = random_draws[:, 2] < RENO_PROBA_INSULATION_UPDATE
+    renovation_scope = (
+        renovate_heating_system * RENOVATE_HEATING_SYSTEM_FLAG
+        | renovate_insulation * RENOVATE_INSULATION_FLAG
+    )
+    np.multiply(
+        renovation_scope, out_is_renovating, out=out_renovation_scope, casting="unsafe"
+    )
+
+
+class HouseholdPopulation:
+    """
+    Struct-of-arrays view of a household population's per-step random decisions.
+
+    Holds one array per decision (indexed by `Household.population_index`) so that
+    decisions which are independent across households can be drawn for the whole
+    population in a single vectorised pass, rather than once per agent.
+    """
+
+    def __init__(self, households: Sequence[Household]):
+        self.households = list(households)
+        for index, household in enumerate(self.households):
+            household.population_index = index
+
+        # Renovation decisions, redrawn at every step
+        self.is_renovating = np.zeros(len(self), dtype=bool)
+        # Bitfields of `RENOVATE_*_FLAG`s, as in `Household.renovation_scope`
+        self.renovation_scope = np.zeros(len(self), dtype=np.uint8)
+
+        # Uniform draws against which heating system failure is tested, redrawn at every step.
+        # Kept as a list since they are read one household at a time
+        self.heating_failure_draws = [1.0] * len(self)
+
+    def __len__(self) -> int:
+        return len(self.households)
+
+    def step(self, model: "DomesticHeatingABM") -> None:
+
+        # One row per household: renovation, renovation scope (heating system, insulation)
+        # and heating system failure
+        random_draws = model.rng.random((len(self), 4))
+        self.heating_failure_draws = random_draws[:, 3].tolist()
+
+        _step_population(
+            random_draws,
+            model.proba_renovate_per_step,
+            self.is_renovating,
+            self.renovation_scope,
+        )
@@ -1,15 +1,24 @@
 import datetime
 import random
 
+import numpy as np
 import pandas as pd
 import pytest
 from dateutil.relativedelta import relativedelta
 
+from simulation.agents import (
+    get_discount_rates,
+    get_renovation_budgets,
+    get_wealth_percentiles,
+)
 from simulation.constants import (
     BOILERS,
+    GLAZING_BITMASK,
     HEAT_PUMPS,
     MAX_HEAT_PUMP_CAPACITY_KW,
     MIN_HEAT_PUMP_CAPACITY_KW,
+    ROOF_BITMASK,
+    WALLS_BITMASK,
     BuiltForm,
     ConstructionYearBand,
     Element,
@@ -70,6 +79,33 @@ class TestHousehold:
         assert household.is_heat_pump_aware
         assert household.is_renovating is not None
 
+    def test_household_attributes_are_stored_in_slots(self) -> None:
+        household = household_factory()
+        assert not hasattr(household, "__dict__")
+
+    @pytest.mark.parametrize(
+        "heating_system,heating_fuel",
+        [
+            (HeatingSystem.BOILER_GAS, HeatingFuel.GAS),
+            (HeatingSystem.BOILER_OIL, HeatingFuel.OIL),
+            (HeatingSystem.BOILER_ELECTRIC, HeatingFuel.ELECTRICITY),
+            (HeatingSystem.HEAT_PUMP_AIR_SOURCE, HeatingFuel.ELECTRICITY),
+            (HeatingSystem.HEAT_PUMP_GROUND_SOURCE, HeatingFuel.ELECTRICITY),
+        ],
+    )
+    def test_household_heating_fuel_matches_heating_system(
+        self, heating_system, heating_fuel
+    ) -> None:
+        household = household_factory(heating_system=heating_system)
+        assert household.heating_fuel is heating_fuel
+
+    def test_household_heating_fuel_follows_installed_heating_system(self) -> None:
+        household = household_factory(heating_system=HeatingSystem.BOILER_GAS)
+        assert household.heating_fuel == HeatingFuel.GAS
+
+        household.install_heating_system(HeatingSystem.BOILER_OIL, model_factory())
+        assert household.heating_fuel == HeatingFuel.OIL
+
     def test_household_renovation_budget_increases_with_property_value(self) -> None:
         low_property_value_household = household_factory(property_value_gbp=100_000)
         medium_property_value_household = household_factory(property_value_gbp=300_000)
@@ -109,7 +145,7 @@ class TestHousehold:
     ) -> None:
 
         household = household_factory(roof_energy_efficiency=pd.NA)
-        assert Element.ROOF not in household.get_upgradable_insulation_elements()
+        assert not household.get_upgradable_insulation_elements() & ROOF_BITMASK
 
     def test_household_elements_under_max_energy_efficiency_score_are_upgradable(
         self,
@@ -121,8 +157,9 @@ class TestHousehold:
             walls_energy_efficiency=2,
         )
 
-        assert household.get_upgradable_insulation_elements() == set(
-            [Element.GLAZING, Element.WALLS]
+        assert (
+            household.get_upgradable_insulation_elements()
+            == GLAZING_BITMASK | WALLS_BITMASK
         )
 
     def test_household_gets_non_zero_insulation_quotes_for_all_upgradable_elements(
@@ -138,8 +175,11 @@ class TestHousehold:
         upgradable_elements = household.get_upgradable_insulation_elements()
         insulation_quotes = household.get_quote_insulation_elements(upgradable_elements)
 
-        assert set(insulation_quotes.keys()) == upgradable_elements
-        assert all(quote > 0 for quote in insulation_quotes.values())
+        for element in Element:
+            if upgradable_elements & (1 << element):
+                assert insulation_quotes[element] > 0
+            else:
+                assert insulation_quotes[element] == 0
 
     def test_household_chooses_one_to_three_insulation_measures_to_install_at_renovation(
         self,
@@ -182,18 +222,27 @@ class TestHousehold:
     ) -> None:
 
         household = household_factory()
-        insulation_quotes = {
-            Element.WALLS: 5_000,
-            Element.GLAZING: 4_000,
-            Element.ROOF: 1_000,
-        }
-        chosen_measures = household.choose_insulation_elements(insulation_quotes, 2)
+        # Quotes indexed by `Element`: roof, glazing, walls
+        insulation_quotes = (1_000, 4_000, 5_000)
+        all_elements = ROOF_BITMASK | GLAZING_BITMASK | WALLS_BITMASK
 
-        assert chosen_measures.keys() == set([Element.ROOF, Element.GLAZING])
+        chosen_measures = household.choose_insulation_elements(
+            insulation_quotes, all_elements, 2
+        )
 
-        chosen_measures = household.choose_insulation_elements(insulation_quotes, 1)
+        assert chosen_measures == {Element.ROOF: 1_000, Element.GLAZING: 4_000}
 
-        assert chosen_measures.keys() == {Element.ROOF}
+        chosen_measures = household.choose_insulation_elements(
+            insulation_quotes, all_elements, 1
+        )
+
+        assert chosen_measures == {Element.ROOF: 1_000}
+
+        chosen_measures = household.choose_insulation_elements(
+            insulation_quotes, GLAZING_BITMASK | WALLS_BITMASK, 1
+        )
+
+        assert chosen_measures == {Element.GLAZING: 4_000}
 
     def test_installation_of_insulation_measures_improves_element_energy_efficiency_and_epc(
         self,
@@ -386,6 +435,21 @@ class TestHousehold:
 
         assert household.discount_rate > higher_wealth_household.discount_rate
 
+    def test_precomputed_wealth_attributes_match_household_wealth_attributes(
+        self,
+    ) -> None:
+
+        property_values_gbp = [0, 50_000, 264_000, 1_000_000, 50_000_000]
+        wealth_percentiles = get_wealth_percentiles(np.array(property_values_gbp))
+        discount_rates = get_discount_rates(wealth_percentiles)
+        renovation_budgets = get_renovation_budgets(wealth_percentiles)
+
+        for i, property_value_gbp in enumerate(property_values_gbp):
+            household = household_factory(property_value_gbp=property_value_gbp)
+            assert household.wealth_percentile == pytest.approx(wealth_percentiles[i])
+            assert household.discount_rate == pytest.approx(discount_rates[i])
+            assert household.renovation_budget == pytest.approx(renovation_budgets[i])
+
     @pytest.mark.parametrize("heat_pump", HEAT_PUMPS)
     def test_larger_household_has_equal_or_higher_required_heat_pump_kw_capacity(
         self, heat_pump
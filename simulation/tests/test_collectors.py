@@ -1,7 +1,10 @@
 import datetime
 
-from simulation.collectors import is_first_timestep
-from simulation.tests.common import model_factory
+import pytest
+
+from simulation.collectors import household_heating_system_previous, is_first_timestep
+from simulation.constants import HeatingSystem
+from simulation.tests.common import household_factory, model_factory
 
 
 def test_is_first_timestep() -> None:
@@ -16,3 +19,20 @@ def test_is_first_timestep() -> None:
 
     model.increment_timestep()
     assert not is_first_timestep(model)
+
+
+def test_household_heating_system_previous_is_none_until_heating_system_replaced() -> None:
+    household = household_factory(heating_system=HeatingSystem.BOILER_OIL)
+    assert household_heating_system_previous(household) is None
+
+
+@pytest.mark.parametrize("heating_system_previous", list(HeatingSystem))
+def test_household_heating_system_previous_is_logged_for_every_heating_system(
+    heating_system_previous,
+) -> None:
+    household = household_factory(heating_system=heating_system_previous)
+    household.install_heating_system(
+        HeatingSystem.HEAT_PUMP_AIR_SOURCE, model_factory()
+    )
+
+    assert household_heating_system_previous(household) == heating_system_previous.name
@@ -8,19 +8,30 @@ from simulation.constants import (
     ENGLAND_WALES_HOUSEHOLD_COUNT_2020,
     HEAT_PUMPS,
     HeatingSystem,
+    InsulationSegment,
 )
 from simulation.costs import (
     BOILER_UPGRADE_SCHEME_GRANT_CAP,
     DECOMMISSIONING_COST_MAX,
+    DOUBLE_GLAZING_UPVC_COST,
     MEAN_COST_GBP_BOILER_GAS,
     estimate_boiler_upgrade_scheme_grant,
     estimate_extended_boiler_upgrade_scheme_grant,
     estimate_rhi_annual_payment,
+    get_cost_bounds_by_segment,
     get_heating_fuel_costs_net_present_value,
     get_unit_and_install_costs,
 )
 from simulation.tests.common import household_factory, model_factory
 
+# Every other heating system, by heating system
+_ALTERNATIVES = {
+    heating_system: tuple(
+        alternative for alternative in HeatingSystem if alternative != heating_system
+    )
+    for heating_system in HeatingSystem
+}
+
 
 class TestCosts:
     @pytest.mark.parametrize("heating_system", set(HeatingSystem))
@@ -31,7 +42,7 @@ class TestCosts:
             heating_system=heating_system
         )
 
-        alternative_system = random.choice(list(set(HeatingSystem) - {heating_system}))
+        alternative_system = random.choice(_ALTERNATIVES[heating_system])
         household_switching_system = household_factory(
             heating_system=alternative_system
         )
@@ -394,3 +405,11 @@ class TestCosts:
             )
             == 5_000
         )
+
+    @pytest.mark.parametrize("segment", list(InsulationSegment))
+    def test_cost_bounds_by_segment_match_cost_intervals(self, segment):
+
+        lows, highs = get_cost_bounds_by_segment(DOUBLE_GLAZING_UPVC_COST)
+
+        assert lows[segment.value] == DOUBLE_GLAZING_UPVC_COST[segment].left
+        assert highs[segment.value] == DOUBLE_GLAZING_UPVC_COST[segment].right
@@ -1,5 +1,6 @@
 import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 from dateutil.relativedelta import relativedelta
@@ -32,6 +33,23 @@ class TestDomesticHeatingABM:
         model.increment_timestep()
         assert model.current_datetime == start_datetime + step_interval
 
+    @pytest.mark.parametrize(
+        "step_interval,step_interval_years",
+        [
+            (relativedelta(months=1), 1 / 12),
+            (relativedelta(months=6), 0.5),
+            (relativedelta(years=1, months=6), 1.5),
+            (datetime.timedelta(days=365), 1),
+        ],
+    )
+    def test_step_interval_years_and_proba_renovate_per_step_are_cached(
+        self, step_interval, step_interval_years
+    ) -> None:
+        model = model_factory(step_interval=step_interval, annual_renovation_rate=0.1)
+
+        assert model.step_interval_years == pytest.approx(step_interval_years)
+        assert model.proba_renovate_per_step == pytest.approx(0.1 * step_interval_years)
+
     def test_increment_timestep_updates_boiler_upgrade_scheme_cumulative_spend_gbp(
         self,
     ) -> None:
@@ -394,3 +412,17 @@ class test_household_agents:
         for household in household_agents:
             household.make_decisions(model)
             assert household.is_heat_pump_aware
+
+
+def test_create_household_agents_is_reproducible_with_seeded_rng() -> None:
+    def heating_system_install_dates(seed):
+        household_agents = create_household_agents(
+            test_household_agents.household_population,
+            [True, True, True, True],
+            test_household_agents.simulation_start_datetime,
+            test_household_agents.all_agents_heat_pump_suitable,
+            np.random.default_rng(seed),
+        )
+        return [household.heating_system_install_date for household in household_agents]
+
+    assert heating_system_install_dates(0) == heating_system_install_dates(0)
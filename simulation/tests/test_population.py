@@ -0,0 +1,100 @@
+import datetime
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from simulation.constants import (
+    RENOVATE_HEATING_SYSTEM_FLAG,
+    RENOVATE_INSULATION_FLAG,
+)
+from simulation.population import HouseholdPopulation, _step_population
+from simulation.tests.common import household_factory, model_factory
+
+
+class TestHouseholdPopulation:
+    def test_population_indexes_households(self) -> None:
+        households = [household_factory() for _ in range(3)]
+        population = HouseholdPopulation(households)
+
+        assert len(population) == 3
+        assert [household.population_index for household in households] == [0, 1, 2]
+
+    def test_all_households_renovate_when_annual_renovation_rate_is_one(self) -> None:
+        model = model_factory(
+            step_interval=relativedelta(months=12),
+            annual_renovation_rate=1.0,
+        )
+        households = [household_factory() for _ in range(100)]
+        model.population = HouseholdPopulation(households)
+
+        model.increment_timestep()
+        assert model.population.is_renovating.all()
+
+        for household in households:
+            household.evaluate_renovation(model)
+            assert household.is_renovating is True
+
+    def test_no_households_renovate_when_annual_renovation_rate_is_zero(self) -> None:
+        model = model_factory(annual_renovation_rate=0.0)
+        households = [household_factory() for _ in range(100)]
+        model.population = HouseholdPopulation(households)
+
+        model.increment_timestep()
+        assert not model.population.is_renovating.any()
+        assert not model.population.renovation_scope.any()
+
+        for household in households:
+            household.evaluate_renovation(model)
+            assert household.is_renovating is False
+            assert household.renovate_heating_system is False
+            assert household.renovate_insulation is False
+
+    def test_households_use_population_heating_failure_draws(self) -> None:
+        model = model_factory(start_datetime=datetime.datetime(2022, 1, 1))
+        households = [
+            household_factory(heating_system_install_date=datetime.date(2010, 1, 1))
+            for _ in range(10)
+        ]
+        model.population = HouseholdPopulation(households)
+
+        model.increment_timestep()
+        assert len(model.population.heating_failure_draws) == 10
+        assert all(0 <= draw < 1 for draw in model.population.heating_failure_draws)
+
+        model.population.heating_failure_draws = [0.0] * 10
+        for household in households:
+            household.update_heating_status(model)
+            assert not household.heating_functioning
+
+        model.population.heating_failure_draws = [1.0] * 10
+        for household in households:
+            household.update_heating_status(model)
+            assert household.heating_functioning
+
+
+def test_step_population_kernel_matches_renovation_probabilities() -> None:
+    random_draws = np.array(
+        [
+            [0.01, 0.10, 0.90],
+            [0.01, 0.90, 0.10],
+            [0.01, 0.10, 0.10],
+            [0.99, 0.10, 0.10],
+        ]
+    )
+    is_renovating = np.zeros(4, dtype=bool)
+    renovation_scope = np.zeros(4, dtype=np.uint8)
+
+    _step_population(
+        random_draws,
+        0.05,
+        is_renovating,
+        renovation_scope,
+    )
+
+    assert is_renovating.tolist() == [True, True, True, False]
+    assert renovation_scope.tolist() == [
+        RENOVATE_HEATING_SYSTEM_FLAG,
+        RENOVATE_INSULATION_FLAG,
+        RENOVATE_HEATING_SYSTEM_FLAG | RENOVATE_INSULATION_FLAG,
+        0,
+    ]